@@ -34,8 +34,14 @@ a variable of class `compound`.
                      property
     read_compound  a method from class `compound` that reads in the data 
                      for a compound into a text file 
+    graphs         a method that graphs a property for a list of compounds
+    fingerprint    a method that hashes the data held in a compound
+    release_diff   a method that writes a changelog of the compounds that
+                     differ between two releases
+    mixture        a class that evaluates liquid density, heat capacity,
+                     viscosity, and bubble points of mixtures of compounds
 """
-import sys, os, string, math
+import sys, os, string, math, hashlib
 import matplotlib.pyplot as plt
 import numpy as np
 import byutpl.equations.dippreqns as eq
@@ -47,6 +53,15 @@ def isnumber(s):
     except ValueError:
         return(False)
 
+# constant properties compared by `fingerprint` and `release_diff`
+cprops=['MW','TC','PC','VC','ZC','MP','TPT','TPP','NBP','LVOL','HFOR','GFOR', \
+        'ENT','HSTD','GSTD','SSTD','HFUS','HCOM','ACEN','RG','SOLP','DM', \
+        'VDWA','VDWV','RI','FP','FLVL','FLTL','FLVU','FLTU','AIT','HSUB', \
+        'PAR','DC']
+
+# equation numbers of the tdep correlations that are evaluated with TC
+tctprops={'LDN':[116,119],'LCP':[114,124],'HVP':[106],'ST':[106],'LTC':[123]}
+
 # The class for each tdep property
 class tcoeff:
     def __init__(self):
@@ -102,15 +117,15 @@ class compound:
             self.coeff[i]=tcoeff()
 
     def read_compound(self,fn):
-    """reads the property data into the self `compound` object
+        """reads the property data into the self `compound` object
     
-    Parameter
-    ----------
-    fn : string
-         name of file containing the data for the compound in 
-         'key\tvalue(s)' form
+        Parameter
+        ----------
+        fn : string
+             name of file containing the data for the compound in 
+             'key\tvalue(s)' form
         
-    """
+        """
         # check to see if the input files exists
         if not os.path.isfile(fn): 
             print("Input file \"" + fn +"\" does not exist.\n")
@@ -159,233 +174,233 @@ class compound:
                 self.coeff[i].c=np.array(data.get(i)[3:]).astype(float)
                 
     def LDN(self,t):
-    """liquid density of the compound
+        """liquid density of the compound
     
-    Parameter
-    ----------
-    t : float
-        temperature (K)
+        Parameter
+        ----------
+        t : float
+            temperature (K)
         
-    Returns
-    -------
-    float
-        the liquid density of the compound at temperature `t` in kmol/m**3
-    """
+        Returns
+        -------
+        float
+            the liquid density of the compound at temperature `t` in kmol/m**3
+        """
         if self.coeff['LDN'].eq == 116 or self.coeff['LDN'].eq == 119: t = 1-t/self.TC
         return(eq.eq(t,self.coeff['LDN'].c,self.coeff['LDN'].eq))
     
     def SDN(self,t):
-    """solid density of the compound
+        """solid density of the compound
     
-    Parameter
-    ----------
-    t : float
-        temperature (K)
+        Parameter
+        ----------
+        t : float
+            temperature (K)
         
-    Returns
-    -------
-    float
-        the solid density of the compound at temperature `t` in kmol/m**3
-    """
+        Returns
+        -------
+        float
+            the solid density of the compound at temperature `t` in kmol/m**3
+        """
         return(eq.eq(t,self.coeff['SDN'].c,self.coeff['SDN'].eq))
     
     def ICP(self,t):
-    """ideal gas heat capacity of the compound
+        """ideal gas heat capacity of the compound
     
-    Parameter
-    ----------
-    t : float
-        temperature (K)
+        Parameter
+        ----------
+        t : float
+            temperature (K)
         
-    Returns
-    -------
-    float
-        the ideal gas heat capacity of the compound at temperature `t` in J/(kmol*K)
-    """
+        Returns
+        -------
+        float
+            the ideal gas heat capacity of the compound at temperature `t` in J/(kmol*K)
+        """
         return(eq.eq(t,self.coeff['ICP'].c,self.coeff['ICP'].eq))
     
     def LCP(self,t):
-    """liquid heat capacity of the compound
+        """liquid heat capacity of the compound
     
-    Parameter
-    ----------
-    t : float
-        temperature (K)
+        Parameter
+        ----------
+        t : float
+            temperature (K)
         
-    Returns
-    -------
-    float
-        the liquid heat capacity of the compound at temperature `t` in J/(kmol*K)
-    """
+        Returns
+        -------
+        float
+            the liquid heat capacity of the compound at temperature `t` in J/(kmol*K)
+        """
         if self.coeff['LCP'].eq == 114 or self.coeff['LCP'].eq == 124: t = 1-t/self.TC
         return(eq.eq(t,self.coeff['LCP'].c,self.coeff['LCP'].eq))
     
     def SCP(self,t):
-    """solid heat capacity of the compound
+        """solid heat capacity of the compound
     
-    Parameter
-    ----------
-    t : float
-        temperature (K)
+        Parameter
+        ----------
+        t : float
+            temperature (K)
         
-    Returns
-    -------
-    float
-        the solid heat capacity of the compound at temperature `t` in J/(kmol*K)
-    """
+        Returns
+        -------
+        float
+            the solid heat capacity of the compound at temperature `t` in J/(kmol*K)
+        """
         return(eq.eq(t,self.coeff['SCP'].c,self.coeff['SCP'].eq))
     
     def HVP(self,t):
-    """heat of vaporization of the compound
+        """heat of vaporization of the compound
     
-    Parameter
-    ----------
-    t : float
-        temperature (K)
+        Parameter
+        ----------
+        t : float
+            temperature (K)
         
-    Returns
-    -------
-    float
-        the heat of vaporization of the compound at temperature `t` in J/kmol
-    """
+        Returns
+        -------
+        float
+            the heat of vaporization of the compound at temperature `t` in J/kmol
+        """
         if self.coeff['HVP'].eq == 106: t = t/self.TC
         return(eq.eq(t,self.coeff['HVP'].c,self.coeff['HVP'].eq))
     
     def SVR(self,t):
-    """second virial coefficient of the compound
+        """second virial coefficient of the compound
     
-    Parameter
-    ----------
-    t : float
-        temperature (K)
+        Parameter
+        ----------
+        t : float
+            temperature (K)
         
-    Returns
-    -------
-    float
-        the second virial coefficient of the compound at temperature `t` in m**3/kmol
-    """
+        Returns
+        -------
+        float
+            the second virial coefficient of the compound at temperature `t` in m**3/kmol
+        """
         return(eq.eq(t,self.coeff['SVR'].c,self.coeff['SVR'].eq))
     
     def ST(self,t):
-    """ surface tension of the compound
+        """ surface tension of the compound
     
-    Parameter
-    ----------
-    t : float
-        temperature (K)
+        Parameter
+        ----------
+        t : float
+            temperature (K)
         
-    Returns
-    -------
-    float
-        the surface tension of the compound at temperature `t` in N/m
-    """
+        Returns
+        -------
+        float
+            the surface tension of the compound at temperature `t` in N/m
+        """
         if self.coeff['ST'].eq == 106: t = t/self.TC
         return(eq.eq(t,self.coeff['ST'].c,self.coeff['ST'].eq))
     
     def LTC(self,t):
-    """ liquid thermal conductivity of the compound
+        """ liquid thermal conductivity of the compound
     
-    Parameter
-    ----------
-    t : float
-        temperature (K)
+        Parameter
+        ----------
+        t : float
+            temperature (K)
         
-    Returns
-    -------
-    float
-        the liquid thermal conductivity of the compound at temperature `t` in W/(m*K)
-    """
+        Returns
+        -------
+        float
+            the liquid thermal conductivity of the compound at temperature `t` in W/(m*K)
+        """
         if self.coeff['LTC'].eq == 123: t = 1-t/self.TC
         return(eq.eq(t,self.coeff['LTC'].c,self.coeff['LTC'].eq))
     
     def VTC(self,t):
-    """ vapor thermal conductivity of the compound
+        """ vapor thermal conductivity of the compound
     
-    Parameter
-    ----------
-    t : float
-        temperature (K)
+        Parameter
+        ----------
+        t : float
+            temperature (K)
         
-    Returns
-    -------
-    float
-        the vapor thermal conductivity of the compound at temperature `t` in W/(m*K)
-    """
+        Returns
+        -------
+        float
+            the vapor thermal conductivity of the compound at temperature `t` in W/(m*K)
+        """
         return(eq.eq(t,self.coeff['VTC'].c,self.coeff['VTC'].eq))
     
     def STC(self,t):
-    """ solid thermal conductivity of the compound
+        """ solid thermal conductivity of the compound
     
-    Parameter
-    ----------
-    t : float
-        temperature (K)
+        Parameter
+        ----------
+        t : float
+            temperature (K)
         
-    Returns
-    -------
-    float
-        the solid thermal conductivity of the compound at temperature `t` in W/(m*K)
-    """
+        Returns
+        -------
+        float
+            the solid thermal conductivity of the compound at temperature `t` in W/(m*K)
+        """
         return(eq.eq(t,self.coeff['STC'].c,self.coeff['STC'].eq))
     
     def VP(self,t):
-    """ liquid vapor pressure of the compound
+        """ liquid vapor pressure of the compound
     
-    Parameter
-    ----------
-    t : float
-        temperature (K)
+        Parameter
+        ----------
+        t : float
+            temperature (K)
         
-    Returns
-    -------
-    float
-        the saturated vapor pressure of the compound at temperature `t` in Pa
-    """
+        Returns
+        -------
+        float
+            the saturated vapor pressure of the compound at temperature `t` in Pa
+        """
         return(eq.eq(t,self.coeff['VP'].c,self.coeff['VP'].eq))
     
     def SVP(self,t):
-    """ solid vapor pressure of the compound
+        """ solid vapor pressure of the compound
     
-    Parameter
-    ----------
-    t : float
-        temperature (K)
+        Parameter
+        ----------
+        t : float
+            temperature (K)
         
-    Returns
-    -------
-    float
-        the pressure of the vapor in equilibrium with the solid of the compound at temperature `t` in Pa
-    """
+        Returns
+        -------
+        float
+            the pressure of the vapor in equilibrium with the solid of the compound at temperature `t` in Pa
+        """
         return(eq.eq(t,self.coeff['SVP'].c,self.coeff['SVP'].eq))
     
     def LVS(self,t):
-    """ liquid viscosity of the compound
+        """ liquid viscosity of the compound
     
-    Parameter
-    ----------
-    t : float
-        temperature (K)
+        Parameter
+        ----------
+        t : float
+            temperature (K)
         
-    Returns
-    -------
-    float
-        the liquid viscosity of the compound at temperature `t` in Pa*s
-    """
+        Returns
+        -------
+        float
+            the liquid viscosity of the compound at temperature `t` in Pa*s
+        """
         return(eq.eq(t,self.coeff['LVS'].c,self.coeff['LVS'].eq))
     
     def VVS(self,t):
-    """ vapor viscosity of the compound
+        """ vapor viscosity of the compound
     
-    Parameter
-    ----------
-    t : float
-        temperature (K)
+        Parameter
+        ----------
+        t : float
+            temperature (K)
         
-    Returns
-    -------
-    float
-        the low-pressure vapor viscosity of the compound at temperature `t` in Pa*s
-    """
+        Returns
+        -------
+        float
+            the low-pressure vapor viscosity of the compound at temperature `t` in Pa*s
+        """
         return(eq.eq(t,self.coeff['VVS'].c,self.coeff['VVS'].eq))
         
 def graphs(c,p):
@@ -469,4 +484,412 @@ def graphs(c,p):
             plt.legend(loc=(1.04, 0))
         plt.show()
  
- 
\ No newline at end of file
+ 
+def fingerprint(c):
+    """Hashes the data held in compound `c`
+    
+    Parameters
+    ----------
+    c : `famcom.compound` object
+    
+    Returns
+    -------
+    dict
+        a dictionary keyed by 'const' and the DIPPR temperature-dependent
+        property names (LDN, SDN, ...). The value of 'const' is a hash of the
+        name, ChemID, and constant properties of `c`. The value for each
+        temperature-dependent property is a hash of the equation number,
+        temperature range, and coefficients of the correlation in `c.coeff`.
+    
+    Two compounds with the same hash for a key hold identical data for
+    that key, so only the keys with different hashes need to be compared.
+    """
+    fp={}
+    h=hashlib.sha1(repr((c.Name,c.ChemID)).encode())
+    h.update(np.array([getattr(c,i) for i in cprops],dtype=float).tobytes())
+    fp['const']=h.hexdigest()
+    for i in c.coeff:
+        h=hashlib.sha1(np.array([c.coeff[i].eq,c.coeff[i].tmin,c.coeff[i].tmax],dtype=float).tobytes())
+        h.update(np.asarray(c.coeff[i].c,dtype=float).tobytes())
+        fp[i]=h.hexdigest()
+    return(fp)
+
+def curve_deviation(c1,c2,p,n=50):
+    """Maximum deviation between the correlations of two compounds
+    
+    Parameters
+    ----------
+    c1 : `famcom.compound` object
+         the reference compound
+    c2 : `famcom.compound` object
+         the compound compared to `c1`
+    p : string
+        DIPPR temperature-dependent property to compare
+    n : int
+        number of temperatures at which the correlations are evaluated
+        
+    Returns
+    -------
+    float
+        the maximum of |p2 - p1| over `n` evenly spaced temperatures in
+        the range where the correlations of `c1` and `c2` overlap, divided
+        by the maximum of |p1| over the same temperatures. nan is returned
+        if the ranges do not overlap or no point can be evaluated.
+    
+    Normalizing by the largest value of `p1` keeps the deviation finite for
+    properties such as HVP and ST that go to zero at the end of the range.
+    """
+    tlo=max(c1.coeff[p].tmin,c2.coeff[p].tmin)
+    thi=min(c1.coeff[p].tmax,c2.coeff[p].tmax)
+    if not tlo < thi: return(float("nan"))
+    t=np.linspace(tlo,thi,n)
+    with np.errstate(all='ignore'):
+        y1=np.asarray(getattr(c1,p)(t),dtype=float)
+        y2=np.asarray(getattr(c2,p)(t),dtype=float)
+        dev=np.abs(y2-y1)
+    if np.all(np.isnan(dev)) or np.all(np.isnan(y1)): return(float("nan"))
+    with np.errstate(all='ignore'):
+        return(float(np.nanmax(dev)/np.nanmax(np.abs(y1))))
+
+def _filehash(fn):
+    # sha1 of the raw bytes of file `fn`, read in blocks
+    h=hashlib.sha1()
+    with open(fn,'rb') as fi:
+        for block in iter(lambda: fi.read(65536), b''):
+            h.update(block)
+    return(h.digest())
+
+def _rangestr(t):
+    # 'eq:tmin-tmax' of the tcoeff `t` for the changelog
+    return(str(t.eq)+':'+str(t.tmin)+'-'+str(t.tmax))
+
+def _diff_chunk(pairs,out,rtol,atol,npts):
+    # compare the compounds in the list of (file, old path, new path) tuples
+    # `pairs` and write the differences to `out`
+    c1=[];c2=[]
+    for f, fn1, fn2 in pairs:
+        c1.append(compound()); c1[-1].read_compound(fn1)
+        c2.append(compound()); c2[-1].read_compound(fn2)
+    fp1=[fingerprint(x) for x in c1]
+    fp2=[fingerprint(x) for x in c2]
+    
+    # compare the constants of all compounds with changed constants at once
+    cindex=[i for i in range(len(pairs)) if fp1[i]['const'] != fp2[i]['const']]
+    a=np.array([[getattr(c1[i],p) for p in cprops] for i in cindex],dtype=float).reshape(-1,len(cprops))
+    b=np.array([[getattr(c2[i],p) for p in cprops] for i in cindex],dtype=float).reshape(-1,len(cprops))
+    row={k:j for j, k in enumerate(cindex)}
+    differ=~np.isclose(a,b,rtol=rtol,atol=atol,equal_nan=True)
+    with np.errstate(all='ignore'):
+        rdev=np.abs(b-a)/np.abs(a)
+    
+    nchanged=0
+    for k in range(len(pairs)):
+        lines=[]
+        f=pairs[k][0]
+        if k in row:
+            j=row[k]
+            for p in ['Name','ChemID']:
+                if getattr(c1[k],p) != getattr(c2[k],p):
+                    lines.append('changed\t'+f+'\t'+p+'\t'+str(getattr(c1[k],p))+'\t'+str(getattr(c2[k],p))+'\t')
+            for i in np.flatnonzero(differ[j]):
+                lines.append('changed\t'+f+'\t'+cprops[i]+'\t'+str(a[j,i].item())+'\t'+str(b[j,i].item())+'\t'+str(rdev[j,i].item()))
+        tcchanged=not np.isclose(c1[k].TC,c2[k].TC,rtol=rtol,atol=atol,equal_nan=True)
+        for p in c1[k].coeff:
+            t1=c1[k].coeff[p]; t2=c2[k].coeff[p]
+            usetc=tcchanged and t1.eq in tctprops.get(p,[]) and t2.eq in tctprops.get(p,[])
+            if fp1[k][p] == fp2[k][p] and not usetc: continue
+            if math.isnan(t1.eq):
+                lines.append('added\t'+f+'\t'+p+'\t\t'+_rangestr(t2)+'\t')
+            elif math.isnan(t2.eq):
+                lines.append('removed\t'+f+'\t'+p+'\t'+_rangestr(t1)+'\t\t')
+            elif t1.eq == t2.eq and t1.tmin == t2.tmin and t1.tmax == t2.tmax and \
+                 t1.c.shape == t2.c.shape and np.allclose(t1.c,t2.c,rtol=rtol,atol=atol) and \
+                 not usetc:
+                continue
+            else:
+                lines.append('changed\t'+f+'\t'+p+'\t'+_rangestr(t1)+'\t'+_rangestr(t2)+'\t'+ \
+                             str(curve_deviation(c1[k],c2[k],p,npts)))
+        if lines:
+            nchanged+=1
+            out.write('\n'.join(lines)+'\n')
+    return(nchanged)
+
+def release_diff(old,new,out=sys.stdout,rtol=1e-9,atol=0.0,npts=50,chunk=1000):
+    """Writes a changelog of the compounds that differ between two releases
+    
+    Parameters
+    ----------
+    old : string
+          directory containing the compound files of the old release
+    new : string
+          directory containing the compound files of the new release
+    out : file object
+          where the changelog is written (default is the screen)
+    rtol, atol : float
+          relative and absolute tolerances below which values are equal
+    npts : int
+          number of temperatures used to find the deviation between two
+          correlations of a temperature-dependent property
+    chunk : int
+          number of changed files that are compared together
+    
+    Returns
+    -------
+    int
+        the number of compounds that were added, removed, or changed
+    
+    Files are matched between `old` and `new` by name. Files whose contents
+    are byte-for-byte identical are skipped without being parsed. The rest
+    are read with `read_compound` in groups of `chunk` files, and only the
+    constants and correlations whose `fingerprint` changed are compared.
+    Each line of the changelog is tab separated with the fields
+    
+        status  file  property  old  new  deviation
+    
+    where status is 'added', 'removed', or 'changed'. For a constant, old
+    and new are the values and deviation is |new - old|/|old|. For a
+    temperature-dependent property, old and new are the equation numbers
+    and ranges as 'eq:tmin-tmax' and deviation is the `curve_deviation`
+    over the overlapping range. Correlations that use TC are also compared
+    when only TC changed.
+    Lines are written as each chunk is finished so that large releases
+    stream to `out`.
+    """
+    for d in [old,new]:
+        if not os.path.isdir(d):
+            print('Release directory \"' + d + '\" does not exist.')
+            return()
+    f1=set(f for f in os.listdir(old) if os.path.isfile(os.path.join(old,f)))
+    f2=set(f for f in os.listdir(new) if os.path.isfile(os.path.join(new,f)))
+    
+    nchanged=0
+    for f in sorted(f1-f2):
+        out.write('removed\t'+f+'\t\t\t\t\n')
+        nchanged+=1
+    for f in sorted(f2-f1):
+        out.write('added\t'+f+'\t\t\t\t\n')
+        nchanged+=1
+    
+    pairs=[]
+    for f in sorted(f1 & f2):
+        fn1=os.path.join(old,f); fn2=os.path.join(new,f)
+        if os.path.getsize(fn1) == os.path.getsize(fn2) and \
+           _filehash(fn1) == _filehash(fn2): continue
+        pairs.append((f,fn1,fn2))
+        if len(pairs) >= chunk:
+            nchanged+=_diff_chunk(pairs,out,rtol,atol,npts)
+            pairs=[]
+    if pairs: nchanged+=_diff_chunk(pairs,out,rtol,atol,npts)
+    return(nchanged)
+
+# The class to evaluate mixture properties from the pure-compound correlations
+class mixture:
+    def __init__(self,c):
+        self.c=list(c)  # list of `famcom.compound` objects in the mixture
+    
+    def _missing(self,p):
+        # print the compounds without a correlation for property `p`;
+        # returns True if any compound is missing one
+        names=[i.Name for i in self.c if math.isnan(i.coeff[p].eq)]
+        for i in names: print('No data for ' + p + ' were found for ' + i + '.')
+        return(bool(names))
+    
+    def _pure(self,p,t):
+        # evaluate property `p` of every compound at each temperature in the
+        # array `t`; returns an array of shape t.shape + (number of compounds,)
+        # or None if a compound has no correlation for `p`
+        if self._missing(p): return(None)
+        t=np.asarray(t,dtype=float)
+        y=[np.broadcast_to(getattr(i,p)(t.ravel()),t.size) for i in self.c]
+        return(np.stack(y,axis=-1).reshape(t.shape+(len(self.c),)))
+    
+    def _args(self,x,t):
+        # put compositions `x` into an (nx,n) array and temperatures `t` into
+        # an (nt,) array; None is returned for `x` if it has the wrong shape
+        x=np.atleast_2d(np.asarray(x,dtype=float))
+        t=np.atleast_1d(np.asarray(t,dtype=float)).ravel()
+        if x.ndim != 2 or x.shape[1] != len(self.c):
+            print('Compositions must have one mole fraction for each of the ' \
+                  + str(len(self.c)) + ' compounds in the mixture.')
+            return(None,t)
+        return(x,t)
+    
+    def LDN(self,x,t,rule='amagat'):
+        """liquid density of the mixture
+        
+        Parameters
+        ----------
+        x : array
+            mole fractions of the compounds, shape (nx,n) for nx compositions
+        t : array
+            temperatures (K), shape (nt,)
+        rule : string
+            mixing rule, 'amagat' (default) or 'rackett'
+            
+        Returns
+        -------
+        array
+            the liquid density of the mixture in kmol/m**3, shape (nx,nt)
+        
+        With 'amagat', the molar volumes of the pure compounds from their
+        `LDN` correlations are added in proportion to mole fraction:
+        1/rho = sum(x_i/rho_i).
+        
+        With 'rackett', the Spencer-Danner form of the Rackett equation is
+        used with the mixture parameters
+            1/rho = R*sum(x_i*Tc_i/Pc_i)*ZRA**(1+(1-T/Tcm)**(2/7))
+            ZRA   = sum(x_i*ZRA_i)
+            Tcm   = sum(phi_i*Tc_i), phi_i = x_i*Vc_i/sum(x_j*Vc_j)
+        where Tc, Pc, and Vc are the TC, PC, and VC of the compounds. ZRA_i
+        is the B coefficient of an `LDN` correlation of DIPPR equation 105,
+        which is the Rackett form, and ZC otherwise. The density is nan
+        above the pseudocritical temperature Tcm.
+        """
+        x,t=self._args(x,t)
+        if x is None: return()
+        if rule == 'amagat':
+            rho=self._pure('LDN',t)
+            if rho is None: return()
+            return(1.0/(x @ (1.0/rho).T))
+        elif rule != 'rackett':
+            print('Mixing rule ' + rule + ' is not available for LDN.')
+            return()
+        
+        zra=np.array([i.coeff['LDN'].c[1] if i.coeff['LDN'].eq == 105 else i.ZC for i in self.c])
+        cindex=[i for i in range(len(self.c)) if np.isnan([self.c[i].TC,self.c[i].PC, \
+                self.c[i].VC,zra[i]]).any()]
+        for i in cindex:
+            print('The Rackett rule needs TC, PC, VC, and ZC or an equation 105 LDN' \
+                  + ' for ' + self.c[i].Name + '.')
+        if cindex: return()
+        tc=np.array([i.TC for i in self.c])
+        pc=np.array([i.PC for i in self.c])
+        vc=np.array([i.VC for i in self.c])
+        R=8314.462618   # gas constant in J/(kmol*K)
+        phi=x*vc/(x @ vc)[:,None]
+        tcm=phi @ tc
+        with np.errstate(invalid='ignore'):
+            v=(R*(x @ (tc/pc)))[:,None]*(x @ zra)[:,None]** \
+              (1.0+(1.0-t[None,:]/tcm[:,None])**(2.0/7.0))
+        return(1.0/v)
+    
+    def LCP(self,x,t):
+        """liquid heat capacity of the mixture
+        
+        Parameters
+        ----------
+        x : array
+            mole fractions of the compounds, shape (nx,n) for nx compositions
+        t : array
+            temperatures (K), shape (nt,)
+            
+        Returns
+        -------
+        array
+            the liquid heat capacity of the mixture in J/(kmol*K), shape (nx,nt)
+        
+        Kay's rule is used: cp = sum(x_i*cp_i).
+        """
+        x,t=self._args(x,t)
+        if x is None: return()
+        cp=self._pure('LCP',t)
+        if cp is None: return()
+        return(x @ cp.T)
+    
+    def LVS(self,x,t,G=None):
+        """liquid viscosity of the mixture
+        
+        Parameters
+        ----------
+        x : array
+            mole fractions of the compounds, shape (nx,n) for nx compositions
+        t : array
+            temperatures (K), shape (nt,)
+        G : array
+            Grunberg-Nissan interaction parameters, shape (n,n), with zeros on
+            the diagonal (default is no interaction)
+            
+        Returns
+        -------
+        array
+            the liquid viscosity of the mixture in Pa*s, shape (nx,nt)
+        
+        The Grunberg-Nissan rule is used:
+        ln(mu) = sum(x_i*ln(mu_i)) + 1/2*sum(sum(x_i*x_j*G_ij)).
+        """
+        x,t=self._args(x,t)
+        if x is None: return()
+        mu=self._pure('LVS',t)
+        if mu is None: return()
+        lnmu=x @ np.log(mu).T
+        if G is not None:
+            lnmu=lnmu+0.5*np.einsum('ki,ij,kj->k',x,np.asarray(G,dtype=float),x)[:,None]
+        return(np.exp(lnmu))
+    
+    def bubble_p(self,x,t):
+        """bubble-point pressure of the mixture
+        
+        Parameters
+        ----------
+        x : array
+            mole fractions of the compounds, shape (nx,n) for nx compositions
+        t : array
+            temperatures (K), shape (nt,)
+            
+        Returns
+        -------
+        tuple of arrays
+            the bubble-point pressure in Pa, shape (nx,nt), and the mole
+            fractions of the vapor at the bubble point, shape (nx,nt,n)
+        
+        Raoult's law is used with the `VP` correlations of the compounds:
+        p = sum(x_i*psat_i) and y_i = x_i*psat_i/p.
+        """
+        x,t=self._args(x,t)
+        if x is None: return()
+        psat=self._pure('VP',t)
+        if psat is None: return()
+        xp=x[:,None,:]*psat[None,:,:]
+        p=xp.sum(axis=-1)
+        return(p,xp/p[...,None])
+    
+    def bubble_t(self,x,p,niter=60):
+        """bubble-point temperature of the mixture
+        
+        Parameters
+        ----------
+        x : array
+            mole fractions of the compounds, shape (nx,n) for nx compositions
+        p : array
+            pressures (Pa), shape (np,)
+        niter : int
+            number of bisection steps
+            
+        Returns
+        -------
+        tuple of arrays
+            the bubble-point temperature in K, shape (nx,np), and the mole
+            fractions of the vapor at the bubble point, shape (nx,np,n)
+        
+        Raoult's law is solved for the temperature where sum(x_i*psat_i) = p
+        by bisection on all compositions and pressures at once. The search
+        is limited to the temperatures where the `VP` correlations of all
+        compounds are valid; nan is returned for points outside that range.
+        """
+        x,p=self._args(x,p)
+        if x is None or self._missing('VP'): return()
+        tlo=max(i.coeff['VP'].tmin for i in self.c)
+        thi=min(i.coeff['VP'].tmax for i in self.c)
+        lo=np.full((x.shape[0],p.size),tlo)
+        hi=np.full((x.shape[0],p.size),thi)
+        # points whose pressure is not bracketed by the valid range have no root
+        pb=lambda tt: (x[:,None,:]*self._pure('VP',tt)).sum(axis=-1)
+        ok=(pb(lo) <= p) & (pb(hi) >= p)
+        for i in range(niter):
+            mid=0.5*(lo+hi)
+            below=pb(mid) < p
+            lo=np.where(below,mid,lo)
+            hi=np.where(below,hi,mid)
+        t=np.where(ok,0.5*(lo+hi),float("nan"))
+        y=x[:,None,:]*self._pure('VP',t)/p[None,:,None]
+        return(t,y)